@@ -373,6 +373,8 @@ subroutine bobyqa(calfun, x, &
 elseif (present(eta2)) then
     if (eta2 > 0 .and. eta2 < 1) then
         eta1_loc = max(EPS, eta2 / 7.0_RP)
+    else
+        eta1_loc = TENTH  ! Otherwise, ETA1_LOC would be undefined when ETA2 is invalid.
     end if
 else
     eta1_loc = TENTH
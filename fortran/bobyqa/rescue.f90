@@ -629,7 +629,10 @@ subroutine rescue(calfun, solver, iprint, maxfun, delta, ftarget, xl, xu, kopt,
     do j = 1, npt
         hcol(1:npt) = matprod(zmat, zmat(j, :))
         hcol(npt + 1:npt + n) = bmat(:, j)
-        call assert(precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0, 'Column '//num2str(j)//' of H is nonzero', srname)
+        ! Call ASSERT only on failure, so that NUM2STR is not invoked for every column on success.
+        if (.not. (precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0)) then
+            call assert(.false., 'Column '//num2str(j)//' of H is nonzero', srname)
+        end if
     end do
 end if
 
@@ -702,7 +705,10 @@ subroutine updateh_rsc(knew, beta, vlag_in, bmat, zmat, info)
     do j = 1, npt
         hcol(1:npt) = matprod(zmat, zmat(j, :))
         hcol(npt + 1:npt + n) = bmat(:, j)
-        call assert(precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0, 'Column '//num2str(j)//' of H is nonzero', srname)
+        ! Call ASSERT only on failure, so that NUM2STR is not invoked for every column on success.
+        if (.not. (precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0)) then
+            call assert(.false., 'Column '//num2str(j)//' of H is nonzero', srname)
+        end if
     end do
 
     ! The following is too expensive to check.
@@ -785,7 +791,10 @@ subroutine updateh_rsc(knew, beta, vlag_in, bmat, zmat, info)
     do j = 1, npt
         hcol(1:npt) = matprod(zmat, zmat(j, :))
         hcol(npt + 1:npt + n) = bmat(:, j)
-        call assert(precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0, 'Column '//num2str(j)//' of H is nonzero', srname)
+        ! Call ASSERT only on failure, so that NUM2STR is not invoked for every column on success.
+        if (.not. (precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0)) then
+            call assert(.false., 'Column '//num2str(j)//' of H is nonzero', srname)
+        end if
     end do
 
     ! The following is too expensive to check.
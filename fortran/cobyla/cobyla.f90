@@ -269,7 +269,7 @@ subroutine cobyla(calcfc, m_nlcon, x, &
 use, non_intrinsic :: history_mod, only : prehist
 use, non_intrinsic :: infnan_mod, only : is_nan, is_finite, is_posinf
 use, non_intrinsic :: infos_mod, only : INVALID_INPUT
-use, non_intrinsic :: linalg_mod, only : trueloc, matprod, maximum
+use, non_intrinsic :: linalg_mod, only : inprod, maximum
 use, non_intrinsic :: memory_mod, only : safealloc
 use, non_intrinsic :: pintrf_mod, only : OBJCON, CALLBACK
 use, non_intrinsic :: selectx_mod, only : isbetter
@@ -326,19 +326,16 @@ subroutine cobyla(calcfc, m_nlcon, x, &
 character(len=*), parameter :: srname = 'COBYLA'
 integer(IK) :: info_loc
 integer(IK) :: iprint_loc
+integer(IK) :: j
 integer(IK) :: m
 integer(IK) :: maxfilt_loc
 integer(IK) :: maxfun_loc
 integer(IK) :: maxhist_loc
 integer(IK) :: meq
 integer(IK) :: mineq
-integer(IK) :: mxl
-integer(IK) :: mxu
 integer(IK) :: n
 integer(IK) :: nf_loc
 integer(IK) :: nhist
-integer(IK), allocatable :: ixl(:)
-integer(IK), allocatable :: ixu(:)
 real(RP) :: cstrv_loc
 real(RP) :: ctol_loc
 real(RP) :: cweight_loc
@@ -375,18 +372,8 @@ subroutine cobyla(calcfc, m_nlcon, x, &
 else
     meq = 0
 end if
-if (present(xl)) then
-    mxl = int(count(xl > -BOUNDMAX), kind(mxl))
-else
-    mxl = 0
-end if
-if (present(xu)) then
-    mxu = int(count(xu < BOUNDMAX), kind(mxu))
-else
-    mxu = 0
-end if
-m = mxu + mxl + 2_IK * meq + mineq + m_nlcon
 n = int(size(x), kind(n))
+! M is defined after GET_LINCON, which counts the nontrivial bounds.
 
 
 ! Preconditions
@@ -467,39 +454,49 @@ subroutine cobyla(calcfc, m_nlcon, x, &
     beq_loc = beq
 end if
 
+! N.B.: Only the bounds provided by the user can contain NaN or values beyond BOUNDMAX, so only they
+! are sanitized. This is done with WHERE while they are copied to XL_LOC and XU_LOC.
 xl_loc = -BOUNDMAX
 if (present(xl)) then
     if (size(xl) > 0) then
-        xl_loc = xl
+        where (is_nan(xl) .or. xl < -BOUNDMAX)
+            xl_loc = -BOUNDMAX
+        elsewhere
+            xl_loc = xl
+        end where
     end if
 end if
-xl_loc(trueloc(is_nan(xl_loc) .or. xl_loc < -BOUNDMAX)) = -BOUNDMAX
-call safealloc(ixl, mxl)
-ixl = trueloc(xl_loc > -BOUNDMAX)
 
 xu_loc = BOUNDMAX
 if (present(xu)) then
     if (size(xu) > 0) then
-        xu_loc = xu
+        where (is_nan(xu) .or. xu > BOUNDMAX)
+            xu_loc = BOUNDMAX
+        elsewhere
+            xu_loc = xu
+        end where
     end if
 end if
-xu_loc(trueloc(is_nan(xu_loc) .or. xu_loc > BOUNDMAX)) = BOUNDMAX
-call safealloc(ixu, mxu)
-ixu = trueloc(xu_loc < BOUNDMAX)
 
 ! Wrap the linear and bound constraints into a single constraint: AMAT^T*X <= BVEC.
 call get_lincon(Aeq_loc, Aineq_loc, beq_loc, bineq_loc, xl_loc, xu_loc, amat, bvec)
+m = int(size(bvec), kind(m)) + m_nlcon  ! SIZE(BVEC) = MXL + MXU + 2*MEQ + MINEQ
 
 ! Allocate memory for CONSTR_LOC.
 call safealloc(constr_loc, m)  ! NOT removable even in F2003!
 
 ! Set [F_LOC, CONSTR_LOC] to [F(X0), CONSTR(X0)] after evaluating the latter if needed. In this way,
 ! COBYLB only needs one interface.
+! The linear constraints are evaluated column by column of AMAT, writing the moderated values directly
+! into CONSTR_LOC. This is equivalent to CONSTR_LOC(1:M - M_NLCON) = MODERATEC(MATPROD(X, AMAT) - BVEC)
+! but without the temporary array for MATPROD(X, AMAT) - BVEC.
+do j = 1, m - m_nlcon
+    constr_loc(j) = moderatec(inprod(x, amat(:, j)) - bvec(j))
+end do
 ! N.B.: Due to the preconditions above, there are two possibilities for F0 and NLCONSTR0.
 ! If NLCONSTR0 is present, then F0 must be present, and we assume that F(X0) = F0 even if F0 is NaN.
 ! If NLCONSTR0 is absent, then F0 must be either absent or NaN, both of which will be interpreted as
 ! F(X0) is not provided and we have to evaluate F(X0) and NLCONSTR(X0) now.
-constr_loc(1:m - m_nlcon) = moderatec(matprod(x, amat) - bvec)
 if (present(f0) .and. present(nlconstr0) .and. all(is_finite(x))) then
     f_loc = moderatef(f0)
     constr_loc(m - m_nlcon + 1:m) = moderatec(nlconstr0)
@@ -509,7 +506,10 @@ subroutine cobyla(calcfc, m_nlcon, x, &
     ! N.B.: Do NOT call FMSG, SAVEHIST, or SAVEFILT for the function/constraint evaluation at X0.
     ! They will be called during the initialization, which will read the function/constraint at X0.
 end if
-cstrv_loc = maximum([ZERO, constr_loc])
+! N.B.: CONSTR_LOC has been moderated and hence contains no NaN. Thus MAX(ZERO, MAXIMUM(CONSTR_LOC))
+! equals MAXIMUM([ZERO, CONSTR_LOC]), but it does not build the concatenated temporary array. If
+! CONSTR_LOC is empty, then MAXIMUM(CONSTR_LOC) = -HUGE(CONSTR_LOC), and CSTRV_LOC = 0 as expected.
+cstrv_loc = max(ZERO, maximum(constr_loc))
 
 ! If RHOBEG is present, then RHOBEG_LOC is a copy of RHOBEG; otherwise, RHOBEG_LOC takes the default
 ! value for RHOBEG, taking the value of RHOEND into account. Note that RHOEND is considered only if
@@ -573,6 +573,8 @@ subroutine cobyla(calcfc, m_nlcon, x, &
 elseif (present(eta2)) then
     if (eta2 > 0 .and. eta2 < 1) then
         eta1_loc = max(EPS, eta2 / 7.0_RP)
+    else
+        eta1_loc = TENTH  ! Otherwise, ETA1_LOC would be undefined when ETA2 is invalid.
     end if
 else
     eta1_loc = TENTH
@@ -771,9 +773,9 @@ subroutine get_lincon(Aeq, Aineq, beq, bineq, xl, xu, amat, bvec)
 !--------------------------------------------------------------------------------------------------!
 
 ! Common modules
-use, non_intrinsic :: consts_mod, only : RP, IK, BOUNDMAX, DEBUGGING
+use, non_intrinsic :: consts_mod, only : RP, IK, ZERO, ONE, BOUNDMAX, DEBUGGING
 use, non_intrinsic :: debug_mod, only : assert
-use, non_intrinsic :: linalg_mod, only : eye, trueloc
+use, non_intrinsic :: linalg_mod, only : trueloc
 use, non_intrinsic :: memory_mod, only : safealloc
 
 implicit none
@@ -792,6 +794,7 @@ subroutine get_lincon(Aeq, Aineq, beq, bineq, xl, xu, amat, bvec)
 
 ! Local variables
 character(len=*), parameter :: srname = 'GET_LINCON'
+integer(IK) :: i
 integer(IK) :: m_lcon
 integer(IK) :: meq
 integer(IK) :: mineq
@@ -800,7 +803,6 @@ subroutine get_lincon(Aeq, Aineq, beq, bineq, xl, xu, amat, bvec)
 integer(IK) :: n
 integer(IK), allocatable :: ixl(:)
 integer(IK), allocatable :: ixu(:)
-real(RP) :: idmat(size(xl), size(xl))
 
 ! Sizes
 n = int(size(xl), kind(n))
@@ -824,11 +826,18 @@ subroutine get_lincon(Aeq, Aineq, beq, bineq, xl, xu, amat, bvec)
 m_lcon = mxl + mxu + 2_IK * meq + mineq  ! The final number of linear inequality constraints.
 
 ! Allocate memory. Removable in F2003.
-call safealloc(ixl, mxl)
-call safealloc(ixu, mxu)
 call safealloc(amat, n, m_lcon)
 call safealloc(bvec, m_lcon)
 
+! Return immediately if there is no linear or bound constraint, which is the case for many problems.
+! AMAT is then N-by-0 and BVEC is empty, and there is nothing else to do.
+if (m_lcon == 0) then
+    return
+end if
+
+call safealloc(ixl, mxl)
+call safealloc(ixu, mxu)
+
 ! Define the indices of the nontrivial bound constraints.
 ixl = trueloc(xl > -BOUNDMAX)
 ixu = trueloc(xu < BOUNDMAX)
@@ -838,11 +847,26 @@ subroutine get_lincon(Aeq, Aineq, beq, bineq, xl, xu, amat, bvec)
 ! The equality constraint Aeq*X = Beq is handled as two constraints -Aeq*X <= -Beq, Aeq*X <= Beq.
 ! N.B.:
 ! 1. The treatment of the equality constraints is naive. One may choose to eliminate them instead.
-! 2. The code below is quite inefficient in terms of memory, but we prefer readability.
-idmat = eye(n, n)
-amat = reshape(shape=shape(amat), source= &
-    & [-idmat(:, ixl), idmat(:, ixu), -transpose(Aeq), transpose(Aeq), transpose(Aineq)])
-bvec = [-xl(ixl), xu(ixu), -beq, beq, bineq]
+! 2. The columns of AMAT for the bound constraints are -IDMAT(:, IXL) and IDMAT(:, IXU), IDMAT being
+! the N-by-N identity matrix. We set their nonzero entries directly instead of forming IDMAT, which
+! would take O(N^2) memory to extract only MXL + MXU columns.
+! 3. AMAT and BVEC have been allocated with their final sizes. We fill them block by block rather
+! than assigning to them array constructors, which would create temporary copies of the whole data.
+amat(:, 1:mxl + mxu) = ZERO
+do i = 1, mxl
+    amat(ixl(i), i) = -ONE
+end do
+do i = 1, mxu
+    amat(ixu(i), mxl + i) = ONE
+end do
+amat(:, mxl + mxu + 1:mxl + mxu + meq) = -transpose(Aeq)
+amat(:, mxl + mxu + meq + 1:mxl + mxu + 2_IK * meq) = transpose(Aeq)
+amat(:, mxl + mxu + 2_IK * meq + 1:m_lcon) = transpose(Aineq)
+bvec(1:mxl) = -xl(ixl)
+bvec(mxl + 1:mxl + mxu) = xu(ixu)
+bvec(mxl + mxu + 1:mxl + mxu + meq) = -beq
+bvec(mxl + mxu + meq + 1:mxl + mxu + 2_IK * meq) = beq
+bvec(mxl + mxu + 2_IK * meq + 1:m_lcon) = bineq
 !!MATLAB code:
 !!amat = [-idmat(:, ixl), idmat(:, ixu), -Aeq', Aeq', Aineq'];
 !!bvec = [-xl(ixl); xu(ixu); -beq; beq; bineq];
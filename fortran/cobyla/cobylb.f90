@@ -717,7 +717,15 @@ subroutine calcfc_internal(x_internal, f_internal, constr_internal)
 ! Outputs
 real(RP), intent(out) :: f_internal
 real(RP), intent(out) :: constr_internal(:)
-constr_internal(1:m_lcon) = matprod(x_internal, amat) - bvec
+! Local variables
+integer(IK) :: j_internal  ! Declared locally so that J of the host is not modified
+! The linear constraints are calculated column by column of AMAT and written to CONSTR_INTERNAL
+! directly. This is the same as CONSTR_INTERNAL(1:M_LCON) = MATPROD(X_INTERNAL, AMAT) - BVEC,
+! without the temporary array, which matters as this subroutine is called at each evaluation.
+! N.B.: The moderation of CONSTR_INTERNAL is done by EVALUATE after this subroutine returns.
+do j_internal = 1, m_lcon
+    constr_internal(j_internal) = inprod(x_internal, amat(:, j_internal)) - bvec(j_internal)
+end do
 call calcfc(x_internal, f_internal, constr_internal(m_lcon + 1:m))
 end subroutine calcfc_internal
 
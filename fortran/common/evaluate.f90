@@ -24,22 +24,24 @@ module evaluate_mod
 contains
 
 
-function moderatex(x) result(y)
+pure elemental function moderatex(x) result(y)
 !--------------------------------------------------------------------------------------------------!
 ! This function moderates a decision variable. It replaces NaN by 0 and Inf/-Inf by REALMAX/-REALMAX.
+! It is ELEMENTAL, so that a vector is moderated in a single loop without any index array.
 !--------------------------------------------------------------------------------------------------!
 use, non_intrinsic :: consts_mod, only : RP, ZERO, REALMAX
 use, non_intrinsic :: infnan_mod, only : is_nan
-use, non_intrinsic :: linalg_mod, only : trueloc
 implicit none
 
 ! Inputs
-real(RP), intent(in) :: x(:)
+real(RP), intent(in) :: x
 ! Outputs
-real(RP) :: y(size(x))
+real(RP) :: y
 
 y = x
-y(trueloc(is_nan(x))) = ZERO
+if (is_nan(y)) then
+    y = ZERO
+end if
 y = max(-REALMAX, min(REALMAX, y))
 end function moderatex
 
@@ -68,24 +70,25 @@ pure elemental function moderatef(f) result(y)
 end function moderatef
 
 
-function moderatec(c) result(y)
+pure elemental function moderatec(c) result(y)
 !--------------------------------------------------------------------------------------------------!
 ! This function moderates the constraint value, the constraint demanding this value to be NONNEGATIVE.
 ! It replaces any value below -CONSTRMAX by -CONSTRMAX, and any NaN or value above CONSTRMAX by
-! CONSTRMAX.
+! CONSTRMAX. The same as MODERATEX, it is ELEMENTAL.
 !--------------------------------------------------------------------------------------------------!
 use, non_intrinsic :: consts_mod, only : RP, CONSTRMAX
 use, non_intrinsic :: infnan_mod, only : is_nan
-use, non_intrinsic :: linalg_mod, only : trueloc
 implicit none
 
 ! Inputs
-real(RP), intent(in) :: c(:)
+real(RP), intent(in) :: c
 ! Outputs
-real(RP) :: y(size(c))
+real(RP) :: y
 
 y = c
-y(trueloc(is_nan(c))) = CONSTRMAX
+if (is_nan(y)) then
+    y = CONSTRMAX
+end if
 y = max(-CONSTRMAX, min(CONSTRMAX, y))
 end function moderatec
 
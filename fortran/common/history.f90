@@ -307,8 +307,10 @@ subroutine savehist(nf, x, xhist, f, fhist, cstrv, chist, constr, conhist)
                 & 'XHIST does not contain a repeating segment of length 1', srname)
         end if
         do i = 2, min(100_IK, nhist / 2_IK)
-            call wassert(.not. all(abs(xhist(:, nhist - i + 1:nhist) - xhist(:, nhist - 2 * i + 1:nhist - i)) <= 0), &
-                & 'XHIST does not contain a repeating segment of length '//num2str(i), srname)
+            ! Call WASSERT only on failure, so that NUM2STR is not invoked for every I on success.
+            if (all(abs(xhist(:, nhist - i + 1:nhist) - xhist(:, nhist - 2 * i + 1:nhist - i)) <= 0)) then
+                call wassert(.false., 'XHIST does not contain a repeating segment of length '//num2str(i), srname)
+            end if
         end do
     end if
 end if
@@ -1176,7 +1176,10 @@ subroutine updateh(knew, kref, d, xpt, idz, bmat, zmat, info)
     do j = 1, npt
         hcol(1:npt) = omega_col(idz, zmat, j)
         hcol(npt + 1:npt + n) = bmat(:, j)
-        call assert(precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0, 'Column '//num2str(j)//' of H is nonzero', srname)
+        ! Call ASSERT only on failure, so that NUM2STR is not invoked for every column on success.
+        if (.not. (precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0)) then
+            call assert(.false., 'Column '//num2str(j)//' of H is nonzero', srname)
+        end if
     end do
 
     call assert(all(is_finite(xpt)), 'XPT is finite', srname)
@@ -1420,7 +1423,10 @@ subroutine updateh(knew, kref, d, xpt, idz, bmat, zmat, info)
     do j = 1, npt
         hcol(1:npt) = omega_col(idz, zmat, j)
         hcol(npt + 1:npt + n) = bmat(:, j)
-        call assert(precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0, 'Column '//num2str(j)//' of H is nonzero', srname)
+        ! Call ASSERT only on failure, so that NUM2STR is not invoked for every column on success.
+        if (.not. (precision(0.0_RP) < precision(0.0D0) .or. sum(abs(hcol)) > 0)) then
+            call assert(.false., 'Column '//num2str(j)//' of H is nonzero', srname)
+        end if
     end do
 
     ! The following is too expensive to check.
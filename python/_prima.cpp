@@ -290,35 +290,24 @@ PYBIND11_MODULE(_prima, m) {
       //==============================
       //  Handle Linear Constraints
       //==============================
+      // The C interface reads Aeq and Aineq in row-major order, so we cast the inputs to C-contiguous
+      // double arrays, which copies them only if needed. The arrays are declared in this scope so that
+      // the data that problem points to is alive until prima_minimize returns.
+      using c_double_array = py::array_t<double, py::array::c_style | py::array::forcecast>;
+      c_double_array A_eq_array, b_eq_array, A_ineq_array, b_ineq_array;
       if( ! A_eq.is_none()) {
-        py::buffer_info A_eq_buffer_info  = A_eq.cast<py::buffer>().request();
-        if (A_eq_buffer_info.format != "d")
-        {
-          throw std::invalid_argument("A_eq must be a double array");
-        }
-        problem.m_eq = A_eq_buffer_info.shape[0];
-        problem.Aeq = (double*) A_eq_buffer_info.ptr;
-        py::buffer_info b_eq_buffer_info  = b_eq.cast<py::buffer>().request();
-        if (b_eq_buffer_info.format != "d")
-        {
-          throw std::invalid_argument("b_eq must be a double array");
-        }
-        problem.beq = (double*) b_eq_buffer_info.ptr;
+        A_eq_array = A_eq.cast<c_double_array>();
+        problem.m_eq = A_eq_array.shape(0);
+        problem.Aeq = (double*) A_eq_array.data();
+        b_eq_array = b_eq.cast<c_double_array>();
+        problem.beq = (double*) b_eq_array.data();
       }
       if( ! A_ineq.is_none()) {
-        py::buffer_info A_ineq_buffer_info  = A_ineq.cast<py::buffer>().request();
-        if (A_ineq_buffer_info.format != "d")
-        {
-          throw std::invalid_argument("A_ineq must be a double array");
-        }
-        problem.m_ineq = A_ineq_buffer_info.shape[0];
-        problem.Aineq = (double*) A_ineq_buffer_info.ptr;
-        py::buffer_info b_ineq_buffer_info  = b_ineq.cast<py::buffer>().request();
-        if (b_ineq_buffer_info.format != "d")
-        {
-          throw std::invalid_argument("b_ineq must be a double array");
-        }
-        problem.bineq = (double*) b_ineq_buffer_info.ptr;
+        A_ineq_array = A_ineq.cast<c_double_array>();
+        problem.m_ineq = A_ineq_array.shape(0);
+        problem.Aineq = (double*) A_ineq_array.data();
+        b_ineq_array = b_ineq.cast<c_double_array>();
+        problem.bineq = (double*) b_ineq_array.data();
       }
       
 
@@ -98,7 +98,7 @@ def _project(x0, lb, ub, constraints):
         # Direct projection onto the bound constraints
         x_proj = np.nanmin((np.nanmax((x0_c, lb_c), axis=0), ub_c), axis=0)
         return OptimizeResult(x=x_proj)
-    elif all(np.less_equal(np.abs(constraints['linear'].ub - constraints['linear'].lb), eps)) and \
+    elif np.less_equal(np.abs(constraints['linear'].ub - constraints['linear'].lb), eps).all() and \
             np.max(lb_c) <= -max_con and np.min(ub_c) >= max_con:
         # The linear constraints are all equality constraints. The projection can therefore be done by solving the
         # least-squares problem: min ||A*x - (b - A*x_0)||.
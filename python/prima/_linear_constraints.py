@@ -38,9 +38,10 @@ def separate_LC_into_eq_and_ineq(linear_constraint):
     A_ineq = np.concatenate((A_ineq_lb, A_ineq_ub))
     b_ineq = np.concatenate((b_ineq_lb, b_ineq_ub))
 
-    # Ensure dtype is float64, or set to None if empty
-    A_eq = np.array(A_eq, dtype=np.float64) if len(A_eq) > 0 else None
-    b_eq = np.array(b_eq, dtype=np.float64) if len(b_eq) > 0 else None
-    A_ineq = np.array(A_ineq, dtype=np.float64) if len(A_ineq) > 0 else None
-    b_ineq = np.array(b_ineq, dtype=np.float64) if len(b_ineq) > 0 else None
+    # Ensure dtype is float64 and the layout is C-contiguous, so that `_prima.cpp` need not copy them,
+    # or set to None if empty.
+    A_eq = np.ascontiguousarray(A_eq, dtype=np.float64) if len(A_eq) > 0 else None
+    b_eq = np.ascontiguousarray(b_eq, dtype=np.float64) if len(b_eq) > 0 else None
+    A_ineq = np.ascontiguousarray(A_ineq, dtype=np.float64) if len(A_ineq) > 0 else None
+    b_ineq = np.ascontiguousarray(b_ineq, dtype=np.float64) if len(b_ineq) > 0 else None
     return A_eq, b_eq, A_ineq, b_ineq
@@ -1,5 +1,6 @@
 import numpy as np
 from prima import LinearConstraint, combine_multiple_linear_constraints, separate_LC_into_eq_and_ineq, minimize
+from prima._prima import minimize as _minimize
 from objective import fun
 
 
@@ -29,3 +30,24 @@ def test_separate_LC_into_eq_and_ineq():
     assert all(b_eq == [5])
     assert (A_ineq == np.array([[-3, -4], [3, 4]])).all()
     assert all(b_ineq == [-6, 8])
+
+
+
+def test_backend_reads_fortran_ordered_linear_constraints():
+    # separate_LC_into_eq_and_ineq always returns C-contiguous arrays, so we call the extension
+    # directly to check that it does not misread Fortran-ordered A_eq and A_ineq.
+    x0 = np.array([0.0, 0.0])
+    # Read row-major, these are x2 <= 3 and 2*x1 <= 100; read column-major, 2*x2 <= 3 and x1 <= 100.
+    A_ineq = np.asfortranarray([[0.0, 1.0], [2.0, 0.0]])
+    b_ineq = np.array([3.0, 100.0])
+    assert not A_ineq.flags['C_CONTIGUOUS']
+    res = _minimize(fun, x0, (), 'lincoa', None, None, None, None, A_ineq, b_ineq, None, None, None)
+    assert np.isclose(res.x[0], 5.0, rtol=1e-6)
+    assert np.isclose(res.x[1], 3.0, rtol=1e-6)
+    # Read row-major, these are x1 = 5 and x1 + x2 = 8; read column-major, x1 + x2 = 5 and x2 = 8.
+    A_eq = np.asfortranarray([[1.0, 0.0], [1.0, 1.0]])
+    b_eq = np.array([5.0, 8.0])
+    assert not A_eq.flags['C_CONTIGUOUS']
+    res = _minimize(fun, np.array([5.0, 3.0]), (), 'lincoa', None, None, A_eq, b_eq, None, None, None, None, None)
+    assert np.isclose(res.x[0], 5.0, rtol=1e-6)
+    assert np.isclose(res.x[1], 3.0, rtol=1e-6)